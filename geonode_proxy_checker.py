@@ -1,21 +1,60 @@
 import requests
+from requests.adapters import HTTPAdapter
 import concurrent.futures
+import asyncio
 import time
 from typing import List, Dict, Tuple
 import argparse
 from datetime import datetime
 import json
 import sys
+import heapq
+import logging
+import socket
+import threading
+from urllib.parse import urlsplit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from tqdm import tqdm
 from tabulate import tabulate
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger('geonode_proxy_checker')
+
+DEFAULT_TEST_URL = 'http://cp.cloudflare.com/generate_204'
+# generate_204 only ever answers 204, so any other reply means the proxy served its own page
+DEFAULT_EXPECTED_STATUS = 204
+
+SEPARATOR = "-" * 100 + "\n"
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+TABLE_HEADERS = ['Proxy', 'Country', 'Anonymity', 'Response Time', 'Protocols', 'Speed', 'UpTime']
+
 class GeoNodeProxyFetcher:
-    def __init__(self):
+    def __init__(self, max_workers: int = 1):
         self.base_url = "https://proxylist.geonode.com/api/proxy-list"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+        # Pages are fetched in parallel from the same host, so share one pool
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=max_workers))
+        self.session.headers.update(self.headers)
+
     def fetch_proxies(self, page: int = 1, limit: int = 500) -> List[Dict]:
         """
         Fetch proxies from GeoNode API
@@ -29,17 +68,16 @@ class GeoNodeProxyFetcher:
 
         try:
             print(f"\nFetching page {page}...")
-            response = requests.get(self.base_url, params=params, headers=self.headers)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             if not data.get('data'):
                 print(f"No data found on page {page}")
                 return []
             
-            proxies = []
-            for proxy in data['data']:
-                proxy_info = {
+            proxies = [
+                {
                     'ip': proxy['ip'],
                     'port': proxy['port'],
                     'protocols': proxy['protocols'],
@@ -48,7 +86,8 @@ class GeoNodeProxyFetcher:
                     'speed': proxy.get('speed', 0),
                     'upTime': proxy.get('upTime', 0)
                 }
-                proxies.append(proxy_info)
+                for proxy in data['data']
+            ]
             
             print(f"Successfully fetched {len(proxies)} proxies from page {page}")
             return proxies
@@ -57,20 +96,70 @@ class GeoNodeProxyFetcher:
             return []
 
 class ProxyChecker:
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_workers: int = 10, thorough: bool = False,
+                 test_url: str = DEFAULT_TEST_URL, connect_timeout: float = 3,
+                 https_test_url: str = None, expected_status: int = None):
         self.timeout = timeout
-        self.test_urls = {
-            'http': 'http://httpbin.org/ip',
-            'https': 'https://httpbin.org/ip'
+        self.connect_timeout = connect_timeout
+        self.thorough = thorough
+        self.test_urls = resolve_test_urls(test_url, https_test_url)
+        # Custom endpoints are assumed to answer 200 unless told otherwise
+        if expected_status is None:
+            expected_status = DEFAULT_EXPECTED_STATUS if test_url == DEFAULT_TEST_URL else 200
+        self.expected_status = expected_status
+
+        self.max_workers = max_workers
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-    def check_proxy(self, proxy_info: Dict) -> Dict:
+        # Worker threads live as long as the checker; each builds its own session on first use
+        self._local = threading.local()
+        self._sessions = []
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pxy')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stop the worker threads and close their sessions
+        """
+        self._executor.shutdown(wait=True)
+        for session in self._sessions:
+            session.close()
+        self._sessions.clear()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Session of the calling thread
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.headers)
+            self._sessions.append(session)
+        return session
+
+    def _release_proxy(self, proxy_url: str):
+        """
+        Drop the pool the adapter keeps for a proxy so sockets don't pile up across thousands of proxies
+        """
+        for adapter in self.session.adapters.values():
+            manager = adapter.proxy_manager.pop(proxy_url, None)
+            if manager is not None:
+                manager.clear()
+
+    def _new_result(self, proxy_info: Dict) -> Dict:
         """
-        Check if a proxy is working by testing both HTTP and HTTPS protocols
+        Build an empty result record for a proxy
         """
-        proxy = f"{proxy_info['ip']}:{proxy_info['port']}"
-        result = {
-            'proxy': proxy,
+        return {
+            'proxy': f"{proxy_info['ip']}:{proxy_info['port']}",
             'country': proxy_info['country'],
             'anonymityLevel': proxy_info['anonymityLevel'],
             'speed': proxy_info['speed'],
@@ -81,87 +170,242 @@ class ProxyChecker:
             'error': None
         }
 
-        # Test HTTP
-        if 'http' in proxy_info['protocols']:
-            try:
-                start_time = time.time()
-                response = requests.get(
-                    self.test_urls['http'],
-                    proxies={'http': f'http://{proxy}'},
-                    timeout=self.timeout
-                )
-                if response.status_code == 200:
-                    result['http'] = True
-                    result['response_time'] = round((time.time() - start_time) * 1000, 2)
-                    print(f"[HTTP OK] {proxy} - {result['response_time']}ms")
-            except Exception as e:
-                result['error'] = str(e)
-                print(f"[HTTP FAIL] {proxy} - {str(e)}")
+    def _probe_protocols(self, protocols: List[str]) -> List[str]:
+        """
+        Pick the protocols to test. A single HTTPS probe proves both CONNECT
+        tunneling and plain forwarding, so only thorough mode tests both.
+        """
+        advertised = [p for p in ('http', 'https') if p in protocols]
+        if self.thorough:
+            return advertised
+        # Prefer HTTPS when advertised, otherwise HTTP
+        return advertised[-1:]
+
+    def _mark_working(self, result: Dict, protocol: str, protocols: List[str]):
+        """
+        Record a passing probe; outside thorough mode it vouches for every advertised protocol
+        """
+        if self.thorough:
+            result[protocol] = True
+            return
+        for p in ('http', 'https'):
+            if p in protocols:
+                result[p] = True
 
-        # Test HTTPS
-        if 'https' in proxy_info['protocols']:
+    def _prioritize(self, proxies: List[Dict]) -> List[Dict]:
+        """
+        Order proxies so the likeliest to work (highest uptime, then fastest) are checked first
+        """
+        return sorted(proxies, key=lambda p: (p['upTime'] or 0, -(p['speed'] or 0)), reverse=True)
+
+    def check_proxy(self, proxy_info: Dict) -> Dict:
+        """
+        Check if a proxy is working over the protocols it advertises
+        """
+        result = self._new_result(proxy_info)
+        proxy = result['proxy']
+
+        # Rule out dead proxies with a plain TCP connect before paying for a full HTTP request
+        try:
+            with socket.create_connection((proxy_info['ip'], int(proxy_info['port'])), timeout=self.connect_timeout):
+                pass
+        except OSError as e:
+            result['error'] = str(e)
+            logger.debug("[TCP FAIL] %s - %s", proxy, e)
+            return result
+
+        # Talk plain HTTP to the proxy; HTTPS targets are tunnelled through it with CONNECT
+        proxy_url = f'http://{proxy}'
+        for protocol in self._probe_protocols(proxy_info['protocols']):
             try:
                 start_time = time.time()
-                response = requests.get(
-                    self.test_urls['https'],
-                    proxies={'https': f'https://{proxy}'},
+                response = self.session.get(
+                    self.test_urls[protocol],
+                    proxies={protocol: proxy_url},
                     timeout=self.timeout
                 )
-                if response.status_code == 200:
-                    result['https'] = True
+                if response.status_code == self.expected_status:
+                    self._mark_working(result, protocol, proxy_info['protocols'])
                     if not result['response_time']:
                         result['response_time'] = round((time.time() - start_time) * 1000, 2)
-                    print(f"[HTTPS OK] {proxy} - {result['response_time']}ms")
+                    logger.debug("[%s OK] %s - %sms", protocol.upper(), proxy, result['response_time'])
             except Exception as e:
                 if not result['error']:
                     result['error'] = str(e)
-                print(f"[HTTPS FAIL] {proxy} - {str(e)}")
+                logger.debug("[%s FAIL] %s - %s", protocol.upper(), proxy, e)
+            finally:
+                self._release_proxy(proxy_url)
 
         return result
 
-    def check_proxies(self, proxies: List[Dict], max_workers: int = 10) -> List[Dict]:
+    async def check_proxy_async(self, session, proxy_info: Dict) -> Dict:
         """
-        Check multiple proxies concurrently
+        Async version of check_proxy running on a shared aiohttp session
+        """
+        result = self._new_result(proxy_info)
+        proxy = result['proxy']
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        # Rule out dead proxies with a plain TCP connect before paying for a full HTTP request
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(proxy_info['ip'], int(proxy_info['port'])),
+                timeout=self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            result['error'] = str(e) or type(e).__name__
+            logger.debug("[TCP FAIL] %s - %s", proxy, result['error'])
+            return result
+
+        # Finish closing the pre-check socket before the probe opens its own connection
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+        for protocol in self._probe_protocols(proxy_info['protocols']):
+            try:
+                start_time = time.time()
+                async with session.get(self.test_urls[protocol], proxy=f'http://{proxy}', timeout=timeout) as response:
+                    if response.status == self.expected_status:
+                        self._mark_working(result, protocol, proxy_info['protocols'])
+                        if not result['response_time']:
+                            result['response_time'] = round((time.time() - start_time) * 1000, 2)
+                        logger.debug("[%s OK] %s - %sms", protocol.upper(), proxy, result['response_time'])
+            except Exception as e:
+                # Timeouts stringify to an empty message
+                error = str(e) or type(e).__name__
+                if not result['error']:
+                    result['error'] = error
+                logger.debug("[%s FAIL] %s - %s", protocol.upper(), proxy, error)
+
+        return result
+
+    def check_proxies(self, proxies: List[Dict]) -> List[Dict]:
+        """
+        Check multiple proxies concurrently on the checker's worker threads
         """
         results = []
-        print(f"\nChecking {len(proxies)} proxies with {max_workers} workers...")
+        print(f"\nChecking {len(proxies)} proxies with {self.max_workers} workers...")
+        proxies = self._prioritize(proxies)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_proxy = {executor.submit(self.check_proxy, proxy): proxy for proxy in proxies}
-            
-            # Create progress bar
+        future_to_proxy = {self._executor.submit(self.check_proxy, proxy): proxy for proxy in proxies}
+        
+        # Create progress bar
+        with tqdm(total=len(proxies), desc="Checking proxies", unit="proxy") as pbar:
+            working = 0
+            for future in concurrent.futures.as_completed(future_to_proxy):
+                result = future.result()
+                results.append(result)
+                working += result['http'] or result['https']
+                pbar.update(1)
+                
+                # Update progress bar with running stats
+                pbar.set_postfix(ok=working, fail=len(results) - working)
+        
+        return results
+
+    async def check_proxies_async(self, proxies: List[Dict]) -> List[Dict]:
+        """
+        Check multiple proxies concurrently on a single event loop
+        """
+        results = []
+        print(f"\nChecking {len(proxies)} proxies with {self.max_workers} concurrent checks...")
+        proxies = self._prioritize(proxies)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        # Each proxy is only visited once, so keep-alive would just leave sockets open
+        connector = aiohttp.TCPConnector(limit=self.max_workers, ttl_dns_cache=300, force_close=True)
+
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            async def bounded_check(proxy_info: Dict) -> Dict:
+                async with semaphore:
+                    return await self.check_proxy_async(session, proxy_info)
+
             with tqdm(total=len(proxies), desc="Checking proxies", unit="proxy") as pbar:
-                for future in concurrent.futures.as_completed(future_to_proxy):
-                    results.append(future.result())
+                working = 0
+                for future in asyncio.as_completed([bounded_check(proxy) for proxy in proxies]):
+                    result = await future
+                    results.append(result)
+                    working += result['http'] or result['https']
                     pbar.update(1)
-                    
-                    # Update progress bar description with current stats
-                    working = len([r for r in results if r['http'] or r['https']])
-                    pbar.set_description(f"Working: {working}/{len(results)}")
-        
+
+                    # Update progress bar with running stats
+                    pbar.set_postfix(ok=working, fail=len(results) - working)
+
         return results
 
+def resolve_test_urls(test_url: str, https_test_url: str = None) -> Dict[str, str]:
+    """
+    Validate the probe URLs. The HTTPS URL is derived from the HTTP one only when it has no
+    explicit port, since a port chosen for plain HTTP won't speak TLS.
+    """
+    parts = urlsplit(test_url)
+    if parts.scheme != 'http' or not parts.hostname:
+        raise ValueError(f"Test URL must be an http:// URL with a host: {test_url}")
+
+    if https_test_url is None:
+        if parts.port is not None:
+            raise ValueError(f"Test URL {test_url} sets a port, so an HTTPS test URL must be given too")
+        https_test_url = parts._replace(scheme='https').geturl()
+    else:
+        https_parts = urlsplit(https_test_url)
+        if https_parts.scheme != 'https' or not https_parts.hostname:
+            raise ValueError(f"HTTPS test URL must be an https:// URL with a host: {https_test_url}")
+
+    return {'http': test_url, 'https': https_test_url}
+
+class TqdmHandler(logging.Handler):
+    """
+    Write log records through tqdm so they print above the progress bar instead of breaking it
+    """
+    def emit(self, record: logging.LogRecord):
+        try:
+            tqdm.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+def setup_logging(verbose: bool = False) -> QueueListener:
+    """
+    Route per-proxy status through a queue so checker threads never block on stdout
+    """
+    log_queue = queue.SimpleQueue()
+    handler = TqdmHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, handler)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
 def save_results(results: List[Dict], output_file: str):
     """
     Save results to a file
     """
     print(f"\nSaving results to {output_file}...")
-    with open(output_file, 'w') as f:
-        f.write(f"Proxy Check Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("-" * 100 + "\n")
-        for result in results:
-            f.write(f"Proxy: {result['proxy']}\n")
-            f.write(f"Country: {result['country']}\n")
-            f.write(f"Anonymity Level: {result['anonymityLevel']}\n")
-            f.write(f"Speed: {result['speed']}\n")
-            f.write(f"UpTime: {result['upTime']}%\n")
-            f.write(f"HTTP Working: {result['http']}\n")
-            f.write(f"HTTPS Working: {result['https']}\n")
-            if result['response_time']:
-                f.write(f"Response Time: {result['response_time']}ms\n")
-            if result['error']:
-                f.write(f"Error: {result['error']}\n")
-            f.write("-" * 100 + "\n")
+    lines = [f"Proxy Check Results - {datetime.now().strftime(TIMESTAMP_FORMAT)}\n", SEPARATOR]
+    for result in results:
+        lines.append(
+            f"Proxy: {result['proxy']}\n"
+            f"Country: {result['country']}\n"
+            f"Anonymity Level: {result['anonymityLevel']}\n"
+            f"Speed: {result['speed']}\n"
+            f"UpTime: {result['upTime']}%\n"
+            f"HTTP Working: {result['http']}\n"
+            f"HTTPS Working: {result['https']}\n"
+        )
+        if result['response_time']:
+            lines.append(f"Response Time: {result['response_time']}ms\n")
+        if result['error']:
+            lines.append(f"Error: {result['error']}\n")
+        lines.append(SEPARATOR)
+
+    # Build the whole report in memory and hand it to the file in one write
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        f.write(''.join(lines))
     print("Results saved successfully!")
 
 def save_working_proxies(results: List[Dict], output_file: str = 'working_proxies.txt'):
@@ -172,17 +416,23 @@ def save_working_proxies(results: List[Dict], output_file: str = 'working_proxie
     
     print(f"\nSaving {len(working_proxies)} working proxies to {output_file}...")
     with open(output_file, 'w') as f:
-        for proxy in working_proxies:
-            f.write(f"{proxy['proxy']}\n")
+        f.write(''.join(f"{proxy['proxy']}\n" for proxy in working_proxies))
     print(f"Working proxies saved to {output_file}")
 
 def print_summary(results: List[Dict], top_n: int = 10):
     """
     Print a detailed summary of the results with focus on fastest proxies
     """
-    working_proxies = [r for r in results if r['http'] or r['https']]
-    http_working = len([r for r in results if r['http']])
-    https_working = len([r for r in results if r['https']])
+    # Tally everything in one pass over the results
+    working_proxies = []
+    http_working = https_working = 0
+    for r in results:
+        http_ok = r['http']
+        https_ok = r['https']
+        http_working += http_ok
+        https_working += https_ok
+        if http_ok or https_ok:
+            working_proxies.append(r)
     
     print("\n=== Summary ===")
     print(f"Total proxies checked: {len(results)}")
@@ -192,12 +442,12 @@ def print_summary(results: List[Dict], top_n: int = 10):
     print(f"Failed proxies: {len(results) - len(working_proxies)}")
     
     if working_proxies:
-        # Sort proxies by response time
-        sorted_proxies = sorted(working_proxies, key=lambda x: x['response_time'] if x['response_time'] else float('inf'))
+        # Pick the fastest proxies by response time without sorting the whole list
+        fastest_proxies = heapq.nsmallest(top_n, working_proxies, key=lambda x: x['response_time'] or float('inf'))
         
         # Prepare data for tabulate
         table_data = []
-        for proxy in sorted_proxies[:top_n]:
+        for proxy in fastest_proxies:
             protocols = []
             if proxy['http']:
                 protocols.append('HTTP')
@@ -216,21 +466,14 @@ def print_summary(results: List[Dict], top_n: int = 10):
         
         # Print fastest proxies table
         print(f"\n=== Top {top_n} Fastest Proxies ===")
-        print(tabulate(
-            table_data,
-            headers=['Proxy', 'Country', 'Anonymity', 'Response Time', 'Protocols', 'Speed', 'UpTime'],
-            tablefmt='grid'
-        ))
+        table = tabulate(table_data, headers=TABLE_HEADERS, tablefmt='grid')
+        print(table)
         
         # Save fastest proxies to a separate file
         fastest_file = 'fastest_proxies.txt'
         with open(fastest_file, 'w') as f:
-            f.write(f"Top {top_n} Fastest Proxies - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(tabulate(
-                table_data,
-                headers=['Proxy', 'Country', 'Anonymity', 'Response Time', 'Protocols', 'Speed', 'UpTime'],
-                tablefmt='grid'
-            ))
+            f.write(f"Top {top_n} Fastest Proxies - {datetime.now().strftime(TIMESTAMP_FORMAT)}\n")
+            f.write(table)
         print(f"\nFastest proxies saved to {fastest_file}")
 
 def main():
@@ -241,32 +484,82 @@ def main():
     parser.add_argument('--pages', '-p', type=int, default=1, help='Number of pages to fetch')
     parser.add_argument('--top', type=int, default=10, help='Number of fastest proxies to display')
     parser.add_argument('--working-file', default='working_proxies.txt', help='Output file for working proxies in IP:PORT format')
+    parser.add_argument('--min-uptime', type=float, default=0, help='Skip proxies whose reported uptime percentage is below this')
+    parser.add_argument('--thorough', action='store_true', help='Test HTTP and HTTPS separately instead of a single probe per proxy')
+    parser.add_argument('--connect-timeout', type=float, default=3, help='Timeout in seconds for the TCP connect that screens out dead proxies')
+    parser.add_argument('--test-url', default=DEFAULT_TEST_URL, help='http:// endpoint requested through each proxy; also probed over HTTPS when it has no explicit port')
+    parser.add_argument('--test-url-https', help='https:// endpoint for HTTPS probes (defaults to --test-url over HTTPS)')
+    parser.add_argument('--expect-status', type=int, help='Status code a working proxy must return (204 for the default test URL, otherwise 200)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Print the result of every individual proxy check')
     args = parser.parse_args()
 
-    # Initialize fetcher and checker
-    fetcher = GeoNodeProxyFetcher()
-    checker = ProxyChecker(timeout=args.timeout)
+    try:
+        resolve_test_urls(args.test_url, args.test_url_https)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+    # Initialize fetcher
+    fetch_workers = max(1, min(args.pages, 8))
+    fetcher = GeoNodeProxyFetcher(max_workers=fetch_workers)
     
     all_proxies = []
     print("Starting proxy fetch and check process...")
     
-    # Fetch proxies from all pages
-    for page in range(1, args.pages + 1):
-        proxies = fetcher.fetch_proxies(page=page)
+    # Fetch proxies from all pages concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+        pages = list(executor.map(fetcher.fetch_proxies, range(1, args.pages + 1)))
+    fetcher.session.close()
+
+    for page, proxies in enumerate(pages, start=1):
         if not proxies:
             print(f"No more proxies found on page {page}")
             break
         all_proxies.extend(proxies)
-        time.sleep(1)  # Be nice to the API
 
     if not all_proxies:
         print("No proxies found!")
         return
 
     print(f"\nTotal proxies found: {len(all_proxies)}")
+
+    # Pages can overlap when the sort order shifts mid-fetch, so check each IP:PORT once
+    seen = set()
+    unique_proxies = []
+    for proxy in all_proxies:
+        key = (proxy['ip'], proxy['port'])
+        if key not in seen:
+            seen.add(key)
+            unique_proxies.append(proxy)
+    if len(unique_proxies) < len(all_proxies):
+        print(f"Skipping {len(all_proxies) - len(unique_proxies)} duplicate proxies")
+    all_proxies = unique_proxies
+
+    # Don't spend checks on proxies GeoNode already reports as unreliable
+    if args.min_uptime:
+        all_proxies = [p for p in all_proxies if (p['upTime'] or 0) >= args.min_uptime]
+        print(f"Proxies with uptime >= {args.min_uptime}%: {len(all_proxies)}")
+        if not all_proxies:
+            print("No proxies left to check!")
+            return
     
-    # Check proxies
-    results = checker.check_proxies(all_proxies, max_workers=args.workers)
+    # Check proxies, falling back to threads when aiohttp isn't installed
+    listener = setup_logging(args.verbose)
+    try:
+        with ProxyChecker(timeout=args.timeout, max_workers=args.workers, thorough=args.thorough,
+                          test_url=args.test_url, connect_timeout=args.connect_timeout,
+                          https_test_url=args.test_url_https,
+                          expected_status=args.expect_status) as checker:
+            if aiohttp is not None:
+                # uvloop's libuv-based loop is a drop-in, faster replacement where available
+                # (uvloop.run only exists from 0.18)
+                run = getattr(uvloop, 'run', None) or asyncio.run
+                results = run(checker.check_proxies_async(all_proxies))
+            else:
+                results = checker.check_proxies(all_proxies)
+    finally:
+        # Flush the per-proxy log lines before the summary
+        listener.stop()
 
     # Save results
     save_results(results, args.output)